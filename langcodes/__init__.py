@@ -11,8 +11,8 @@ on the functions in langcodes, scroll down and read the docstrings.
 Some of these functions, particularly those that work with the names of
 languages, require the `language_data` module to be installed.
 """
-from operator import itemgetter
 from typing import Any, List, Tuple, Dict, Sequence, Iterable, Optional, Mapping, Union
+from functools import lru_cache
 import warnings
 import sys
 
@@ -45,6 +45,76 @@ Or as an optional feature of langcodes:
 """
 
 
+def _import_names():
+    """
+    Import the `language_data.names` module, explaining how to install
+    `language_data` if it's missing.
+    """
+    try:
+        from language_data import names
+    except ImportError:
+        print(LANGUAGE_NAME_IMPORT_MESSAGE, file=sys.stdout)
+        raise
+    return names
+
+
+@lru_cache(maxsize=4096)
+def _name_to_code(tagtype: str, name: str, language: str) -> Optional[str]:
+    """
+    Look up the code for a name using `language_data`. Names can be arbitrary
+    input, so the results are kept in a bounded cache.
+    """
+    return _import_names().name_to_code(tagtype, name, language)
+
+
+@lru_cache(maxsize=4096)
+def _code_to_name(attribute: str, code: str, language: str, max_distance: int) -> str:
+    """
+    Look up the name of a language, script or territory code in the given
+    language. Finding the best name involves matching the target language
+    against every language the name is available in, so the results are kept
+    in a bounded cache.
+    """
+    code_to_names = _import_names().code_to_names
+    target = Language.get(language, normalize=False)
+    names = code_to_names(code)
+
+    result = _best_name(names, target, max_distance)
+    if result is not None:
+        return result
+    else:
+        # Construct a string like "Unknown language [zzz]"
+        placeholder = None
+        if attribute == 'language':
+            placeholder = 'und'
+        elif attribute == 'script':
+            placeholder = 'Zzzz'
+        elif attribute == 'territory':
+            placeholder = 'ZZ'
+
+        unknown_name = None
+        if placeholder is not None:
+            names = code_to_names(placeholder)
+            unknown_name = _best_name(names, target, max_distance)
+        if unknown_name is None:
+            unknown_name = 'Unknown language subtag'
+        return f'{unknown_name} [{code}]'
+
+
+def _best_name(names: Mapping[str, str], language: 'Language', max_distance: int):
+    # There are only a few broader tags, but there can be names in
+    # hundreds of languages, so filter from the smaller side
+    possible_languages = sorted(
+        tag for tag in language.broader_tags() if tag in names
+    )
+
+    target_language, score = closest_match(language, possible_languages, max_distance)
+    if target_language in names:
+        return names[target_language]
+    else:
+        return names.get(DEFAULT_LANGUAGE)
+
+
 class Language:
     """
     The Language class defines the results of parsing a language tag.
@@ -163,8 +233,9 @@ class Language:
             tuple(extensions or ()),
             private,
         )
-        if values in cls._INSTANCES:
-            return cls._INSTANCES[values]
+        instance = cls._INSTANCES.get(values)
+        if instance is not None:
+            return instance
 
         instance = cls(
             language=language,
@@ -287,8 +358,9 @@ class Language:
             # way that we've already solved.
             tag = tag.to_tag()
 
-        if (tag, normalize) in Language._PARSE_CACHE:
-            return Language._PARSE_CACHE[tag, normalize]
+        cached = Language._PARSE_CACHE.get((tag, normalize))
+        if cached is not None:
+            return cached
 
         data: Dict[str, Any] = {}
 
@@ -297,9 +369,8 @@ class Language:
         # hyphens when checking, because the case normalization that comes from
         # parse_tag() hasn't been applied yet.
 
-        tag_lower = normalize_characters(tag)
-        if normalize and tag_lower in LANGUAGE_REPLACEMENTS:
-            tag = LANGUAGE_REPLACEMENTS[tag_lower]
+        if normalize:
+            tag = LANGUAGE_REPLACEMENTS.get(normalize_characters(tag), tag)
 
         components = parse_tag(tag)
 
@@ -481,11 +552,9 @@ class Language:
         """
         if self._macrolanguage is not None:
             return self._macrolanguage
-        language = self.language or 'und'
-        if language in NORMALIZED_MACROLANGUAGES:
-            self._macrolanguage = self.update_dict(
-                {'language': NORMALIZED_MACROLANGUAGES[language]}
-            )
+        macrolanguage = NORMALIZED_MACROLANGUAGES.get(self.language or 'und')
+        if macrolanguage is not None:
+            self._macrolanguage = self.update_dict({'language': macrolanguage})
         else:
             self._macrolanguage = self
         return self._macrolanguage
@@ -584,15 +653,13 @@ class Language:
         """
         if self._broader is not None:
             return self._broader
-        self._broader = [self.to_tag()]
-        seen = set([self.to_tag()])
+        tags = [self.to_tag()]
         for keyset in self.BROADER_KEYSETS:
             for start_language in (self, self.prefer_macrolanguage()):
-                filtered = start_language._filter_attributes(keyset)
-                tag = filtered.to_tag()
-                if tag not in seen:
-                    self._broader.append(tag)
-                    seen.add(tag)
+                tags.append(start_language._filter_attributes(keyset).to_tag())
+
+        # Remove duplicates, keeping the first occurrence of each tag
+        self._broader = list(dict.fromkeys(tags))
         return self._broader
 
     def broaden(self) -> 'List[Language]':
@@ -648,8 +715,9 @@ class Language:
             return self._filled
 
         for tag in self.broader_tags():
-            if tag in LIKELY_SUBTAGS:
-                result = Language.get(LIKELY_SUBTAGS[tag], normalize=False)
+            likely_tag = LIKELY_SUBTAGS.get(tag)
+            if likely_tag is not None:
+                result = Language.get(likely_tag, normalize=False)
                 result = result.update(self)
                 self._filled = result
                 return result
@@ -853,12 +921,6 @@ class Language:
     def _get_name(
         self, attribute: str, language: Union[str, 'Language'], max_distance: int
     ) -> str:
-        try:
-            from language_data.names import code_to_names
-        except ImportError:
-            print(LANGUAGE_NAME_IMPORT_MESSAGE, file=sys.stdout)
-            raise
-
         assert attribute in self.ATTRIBUTES
         if isinstance(language, str):
             language = Language.get(language)
@@ -869,44 +931,7 @@ class Language:
                 attr_value = 'und'
             else:
                 return None
-        names = code_to_names(attr_value)
-
-        result = self._best_name(names, language, max_distance)
-        if result is not None:
-            return result
-        else:
-            # Construct a string like "Unknown language [zzz]"
-            placeholder = None
-            if attribute == 'language':
-                placeholder = 'und'
-            elif attribute == 'script':
-                placeholder = 'Zzzz'
-            elif attribute == 'territory':
-                placeholder = 'ZZ'
-
-            unknown_name = None
-            if placeholder is not None:
-                names = code_to_names(placeholder)
-                unknown_name = self._best_name(names, language, max_distance)
-            if unknown_name is None:
-                unknown_name = 'Unknown language subtag'
-            return f'{unknown_name} [{attr_value}]'
-
-    def _best_name(
-        self, names: Mapping[str, str], language: 'Language', max_distance: int
-    ):
-        matchable_languages = set(language.broader_tags())
-        possible_languages = [
-            key for key in sorted(names.keys()) if key in matchable_languages
-        ]
-
-        target_language, score = closest_match(
-            language, possible_languages, max_distance
-        )
-        if target_language in names:
-            return names[target_language]
-        else:
-            return names.get(DEFAULT_LANGUAGE)
+        return _code_to_name(attribute, attr_value, language.to_tag(), max_distance)
 
     def language_name(
         self,
@@ -1290,8 +1315,9 @@ class Language:
             raise
 
         lang = self._filter_attributes(['language', 'script', 'territory'])
-        if str(lang) in LANGUAGE_WRITING_POPULATION:
-            return LANGUAGE_WRITING_POPULATION[str(lang)]
+        population = LANGUAGE_WRITING_POPULATION.get(str(lang))
+        if population is not None:
+            return population
         else:
             lang = lang.simplify_script()
             return LANGUAGE_WRITING_POPULATION.get(str(lang), 0)
@@ -1370,12 +1396,6 @@ class Language:
         >>> Language.find_name('language', 'Hakka dialect')
         Language.make(language='hak')
         """
-        try:
-            from language_data.names import name_to_code
-        except ImportError:
-            print(LANGUAGE_NAME_IMPORT_MESSAGE, file=sys.stdout)
-            raise
-
         # No matter what form of language we got, normalize it to a single
         # language subtag
         if isinstance(language, Language):
@@ -1385,7 +1405,7 @@ class Language:
         if language is None:
             language = 'und'
 
-        code = name_to_code(tagtype, name, language)
+        code = _name_to_code(tagtype, name, language)
         if code is None:
             raise LookupError(f"Can't find any {tagtype} named {name!r}")
         if '-' in code:
@@ -1538,6 +1558,7 @@ find_name = Language.find_name
 LanguageData = Language
 
 
+@lru_cache(maxsize=4096)
 def standardize_tag(tag: Union[str, Language], macro: bool = False) -> str:
     """
     Standardize a language tag:
@@ -1900,18 +1921,14 @@ def closest_match(
     if desired_language in supported_languages:
         return desired_language, 0
 
-    match_distances = [
-        (supported, tag_distance(desired_language, supported, ignore_script))
-        for supported in supported_languages
-    ]
-    match_distances = [
-        (supported, distance)
-        for (supported, distance) in match_distances
-        if distance <= max_distance
-    ] + [('und', 1000)]
-
-    match_distances.sort(key=itemgetter(1))
-    return match_distances[0]
+    # Keep only the best match so far. Using a strict comparison means the
+    # first language in a tie wins.
+    best_supported, best_distance = 'und', 1000
+    for supported in supported_languages:
+        distance = tag_distance(desired_language, supported, ignore_script)
+        if distance <= max_distance and distance < best_distance:
+            best_supported, best_distance = supported, distance
+    return best_supported, best_distance
 
 
 def closest_supported_match(
@@ -1,13 +1,21 @@
-import json
+from collections import defaultdict
+from functools import lru_cache
 import xml.etree.ElementTree as ET
 from langcodes.util import data_filename
 from langcodes.registry_parser import parse_registry
 
+try:
+    # orjson is optional; it parses the CLDR JSON data faster than the stdlib
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 
 def read_cldr_supplemental(dataname):
     cldr_supp_path = data_filename('cldr-json/cldr-json/cldr-core/supplemental')
     filename = data_filename(f'{cldr_supp_path}/{dataname}.json')
-    fulldata = json.load(open(filename, encoding='utf-8'))
+    with open(filename, 'rb') as infile:
+        fulldata = json_loads(infile.read())
     if dataname == 'aliases':
         data = fulldata['supplemental']['metadata']['alias']
     else:
@@ -15,9 +23,15 @@ def read_cldr_supplemental(dataname):
     return data
 
 
+@lru_cache(maxsize=None)
+def read_iana_registry():
+    # Several of the functions below need the registry, so parse it only once
+    return tuple(parse_registry())
+
+
 def read_iana_registry_suppress_scripts():
     scripts = {}
-    for entry in parse_registry():
+    for entry in read_iana_registry():
         if entry['Type'] == 'language' and 'Suppress-Script' in entry:
             scripts[entry['Subtag']] = entry['Suppress-Script']
     return scripts
@@ -25,7 +39,7 @@ def read_iana_registry_suppress_scripts():
 
 def read_iana_registry_scripts():
     scripts = set()
-    for entry in parse_registry():
+    for entry in read_iana_registry():
         if entry['Type'] == 'script':
             scripts.add(entry['Subtag'])
     return scripts
@@ -33,7 +47,7 @@ def read_iana_registry_scripts():
 
 def read_iana_registry_macrolanguages():
     macros = {}
-    for entry in parse_registry():
+    for entry in read_iana_registry():
         if entry['Type'] == 'language' and 'Macrolanguage' in entry:
             macros[entry['Subtag']] = entry['Macrolanguage']
     return macros
@@ -41,7 +55,7 @@ def read_iana_registry_macrolanguages():
 
 def read_iana_registry_replacements():
     replacements = {}
-    for entry in parse_registry():
+    for entry in read_iana_registry():
         if entry['Type'] == 'language' and 'Preferred-Value' in entry:
             # Replacements for language codes
             replacements[entry['Subtag']] = entry['Preferred-Value']
@@ -52,18 +66,17 @@ def read_iana_registry_replacements():
 
 
 def write_python_dict(outfile, name, d):
-    print(f"{name} = {{", file=outfile)
-    for key in sorted(d):
-        value = d[key]
-        print(f"    {key!r}: {value!r},", file=outfile)
-    print("}", file=outfile)
+    lines = [f"{name} = {{"]
+    lines.extend(f"    {key!r}: {d[key]!r}," for key in sorted(d))
+    lines.append("}\n")
+    outfile.write("\n".join(lines))
 
 
 def write_python_set(outfile, name, s):
-    print(f"{name} = {{", file=outfile)
-    for key in sorted(set(s)):
-        print(f"    {key!r},", file=outfile)
-    print("}", file=outfile)
+    lines = [f"{name} = {{"]
+    lines.extend(f"    {key!r}," for key in sorted(set(s)))
+    lines.append("}\n")
+    outfile.write("\n".join(lines))
 
 
 GENERATED_HEADER = "# This file is generated by build_data.py."
@@ -96,11 +109,12 @@ def read_language_distances():
     matches = root.findall(
         './languageMatching/languageMatches[@type="written_new"]/languageMatch'
     )
-    tag_distances = {}
+    tag_distances = defaultdict(dict)
     for match in matches:
         attribs = match.attrib
         n_parts = attribs['desired'].count('_') + 1
         if n_parts < 3:
+            distance = int(attribs['distance'])
             if attribs.get('oneway') == 'true':
                 pairs = [(attribs['desired'], attribs['supported'])]
             else:
@@ -109,8 +123,7 @@ def read_language_distances():
                     (attribs['supported'], attribs['desired']),
                 ]
             for (desired, supported) in pairs:
-                desired_distance = tag_distances.setdefault(desired, {})
-                desired_distance[supported] = int(attribs['distance'])
+                tag_distances[desired][supported] = distance
 
                 # The 'languageInfo' data file contains distances for the unnormalized
                 # tag 'sh', but we work mostly with normalized tags, and they don't
@@ -130,10 +143,9 @@ def read_language_distances():
                         supported = 'sr'
                     if desired != supported:
                         # don't try to define a non-zero distance for sr <=> sr
-                        desired_distance = tag_distances.setdefault(desired, {})
-                        desired_distance[supported] = int(attribs['distance']) + 1
+                        tag_distances[desired][supported] = distance + 1
 
-    return tag_distances
+    return dict(tag_distances)
 
 
 def build_data():
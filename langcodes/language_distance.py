@@ -1,97 +1,109 @@
 from .data_dicts import LANGUAGE_DISTANCES
+from functools import lru_cache
 from typing import Dict, Tuple
 
 
 TagTriple = Tuple[str, str, str]
-_DISTANCE_CACHE: Dict[Tuple[TagTriple, TagTriple], int] = {}
 DEFAULT_LANGUAGE_DISTANCE = LANGUAGE_DISTANCES["*"]["*"]
 DEFAULT_SCRIPT_DISTANCE = LANGUAGE_DISTANCES["*_*"]["*_*"]
 DEFAULT_TERRITORY_DISTANCE = 4
 
+# LANGUAGE_DISTANCES is nested by desired and supported tag. Flatten it so that
+# looking up a pair is a single dictionary lookup.
+_PAIR_DISTANCES: Dict[Tuple[str, str], int] = {
+    (desired, supported): distance
+    for desired, distances in LANGUAGE_DISTANCES.items()
+    for supported, distance in distances.items()
+}
+
 
 # Territory clusters used in territory matching:
 # Maghreb (the western Arab world)
-MAGHREB = {"MA", "DZ", "TN", "LY", "MR", "EH"}
+MAGHREB = frozenset({"MA", "DZ", "TN", "LY", "MR", "EH"})
 
 # United States and its territories
-US = {"AS", "GU", "MH", "MP", "PR", "UM", "US", "VI"}
+US = frozenset({"AS", "GU", "MH", "MP", "PR", "UM", "US", "VI"})
 
 # Special Autonomous Regions of China
-CNSAR = {"HK", "MO"}
-
-LATIN_AMERICA = {
-    "419",
-    # Central America
-    "013",
-    "BZ",
-    "CR",
-    "SV",
-    "GT",
-    "HN",
-    "MX",
-    "NI",
-    "PA",
-    # South America
-    "005",
-    "AR",
-    "BO",
-    "BR",
-    "CL",
-    "CO",
-    "EC",
-    "FK",
-    "GF",
-    "GY",
-    "PY",
-    "PE",
-    "SR",
-    "UY",
-    "VE",
-}
+CNSAR = frozenset({"HK", "MO"})
+
+LATIN_AMERICA = frozenset(
+    {
+        "419",
+        # Central America
+        "013",
+        "BZ",
+        "CR",
+        "SV",
+        "GT",
+        "HN",
+        "MX",
+        "NI",
+        "PA",
+        # South America
+        "005",
+        "AR",
+        "BO",
+        "BR",
+        "CL",
+        "CO",
+        "EC",
+        "FK",
+        "GF",
+        "GY",
+        "PY",
+        "PE",
+        "SR",
+        "UY",
+        "VE",
+    }
+)
 
 # North and South America
-AMERICAS = {
-    "019",
-    # Caribbean
-    "029",
-    "AI",
-    "AG",
-    "AW",
-    "BS",
-    "BB",
-    "VG",
-    "BQ",
-    "KY",
-    "CU",
-    "CW",
-    "DM",
-    "DO",
-    "GD",
-    "GP",
-    "HT",
-    "JM",
-    "MQ",
-    "MS",
-    "PR",
-    "SX",
-    "BL",
-    "KN",
-    "LC",
-    "MF",
-    "VC",
-    "TT",
-    "TC",
-    "VI",
-    # Northern America
-    "021",
-    "BM",
-    "CA",
-    "GL",
-    "PM",
-    "US",
-    # North America as a whole
-    "003",
-} | LATIN_AMERICA
+AMERICAS = frozenset(
+    {
+        "019",
+        # Caribbean
+        "029",
+        "AI",
+        "AG",
+        "AW",
+        "BS",
+        "BB",
+        "VG",
+        "BQ",
+        "KY",
+        "CU",
+        "CW",
+        "DM",
+        "DO",
+        "GD",
+        "GP",
+        "HT",
+        "JM",
+        "MQ",
+        "MS",
+        "PR",
+        "SX",
+        "BL",
+        "KN",
+        "LC",
+        "MF",
+        "VC",
+        "TT",
+        "TC",
+        "VI",
+        # Northern America
+        "021",
+        "BM",
+        "CA",
+        "GL",
+        "PM",
+        "US",
+        # North America as a whole
+        "003",
+    }
+) | LATIN_AMERICA
 
 
 def tuple_distance_cached(desired: TagTriple, supported: TagTriple) -> int:
@@ -104,30 +116,20 @@ def tuple_distance_cached(desired: TagTriple, supported: TagTriple) -> int:
     if supported == desired:
         return 0
 
-    # If we've already figured it out, return the cached distance.
-    if (desired, supported) in _DISTANCE_CACHE:
-        return _DISTANCE_CACHE[desired, supported]
-    else:
-        result = _tuple_distance(desired, supported)
-        _DISTANCE_CACHE[desired, supported] = result
-        return result
-
-
-def _get2(dictionary: dict, key1: str, key2: str, default):
-    return dictionary.get(key1, {}).get(key2, default)
+    return _tuple_distance(desired, supported)
 
 
+# The cache is bounded so that a long-running process, such as a server
+# matching many different Accept-Language headers, doesn't grow it forever.
+@lru_cache(maxsize=4096)
 def _tuple_distance(desired: TagTriple, supported: TagTriple) -> int:
     desired_language, desired_script, desired_territory = desired
     supported_language, supported_script, supported_territory = supported
     distance = 0
 
     if desired_language != supported_language:
-        distance += _get2(
-            LANGUAGE_DISTANCES,
-            desired_language,
-            supported_language,
-            DEFAULT_LANGUAGE_DISTANCE,
+        distance += _PAIR_DISTANCES.get(
+            (desired_language, supported_language), DEFAULT_LANGUAGE_DISTANCE
         )
 
     desired_script_pair = f"{desired_language}_{desired_script}"
@@ -139,11 +141,8 @@ def _tuple_distance(desired: TagTriple, supported: TagTriple) -> int:
         # read 'Latn' can read 'Cyrl', but there is plenty of reason to believe
         # someone who can read 'sr-Latn' can read 'sr-Cyrl' because Serbian is
         # a language written in two scripts.
-        distance += _get2(
-            LANGUAGE_DISTANCES,
-            desired_script_pair,
-            supported_script_pair,
-            DEFAULT_SCRIPT_DISTANCE,
+        distance += _PAIR_DISTANCES.get(
+            (desired_script_pair, supported_script_pair), DEFAULT_SCRIPT_DISTANCE
         )
 
     if desired_territory != supported_territory:
@@ -5,8 +5,9 @@ LIST_KEYS = {'Description', 'Prefix'}
 
 def parse_file(file):
     """
-    Take an open file containing the IANA subtag registry, and yield a
-    dictionary of information for each subtag it describes.
+    Take an open file (or another iterable of lines) containing the IANA
+    subtag registry, and yield a dictionary of information for each subtag it
+    describes.
     """
     lines = []
     for line in file:
@@ -35,11 +36,14 @@ def parse_item(lines):
     """
     info = {}
     for line in lines:
-        key, value = line.split(': ', 1)
+        key, sep, value = line.partition(': ')
+        if not sep:
+            raise ValueError(f"Malformed registry line: {line!r}")
         if key in LIST_KEYS:
             info.setdefault(key, []).append(value)
         else:
-            assert key not in info
+            if key in info:
+                raise ValueError(f"Duplicate registry key: {key!r}")
             info[key] = value
 
     if 'Subtag' in info or 'Tag' in info:
@@ -54,6 +58,11 @@ def parse_registry():
     with open(
         data_filename('language-subtag-registry.txt'), encoding='utf-8'
     ) as data_file:
-        # 'yield from' instead of returning, so that we only close the file
-        # when finished.
-        yield from parse_file(data_file)
+        # The registry is small enough to read at once, and splitting it in
+        # one pass is faster than iterating over the file line by line.
+        # Split only on '\n' as file iteration does, and drop the empty
+        # string after the final newline.
+        lines = data_file.read().split('\n')
+    if not lines[-1]:
+        lines.pop()
+    yield from parse_file(lines)
@@ -0,0 +1,13 @@
+import pytest
+
+from langcodes.registry_parser import parse_file
+
+
+def test_malformed_line():
+    with pytest.raises(ValueError):
+        list(parse_file(['Type: language', 'garbage', '%%']))
+
+
+def test_duplicate_key():
+    with pytest.raises(ValueError):
+        list(parse_file(['Type: language', 'Subtag: en', 'Subtag: fr', '%%']))